@@ -1,7 +1,13 @@
+import json
 import logging
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of large station lists
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +34,8 @@ class ChannelsDVRClient:
         """Fetch Gracenote station data for the given station list name."""
         resp = self.session.get(f"{self.base_url}/dvr/guide/stations/{station_list}")
         resp.raise_for_status()
-        data = resp.json()
+        # Parse the raw body bytes directly, skipping requests' text decode step
+        data = orjson.loads(resp.content) if orjson is not None else json.loads(resp.content)
         # Channels DVR occasionally wraps the list in an outer list
         if isinstance(data, list) and data and isinstance(data[0], list):
             return data[0]
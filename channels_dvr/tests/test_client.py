@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock
 
 from channels_dvr.client import ChannelsDVRClient
@@ -8,6 +9,10 @@ def _client(base_url: str = "http://dvr:8089") -> tuple[ChannelsDVRClient, Magic
     return ChannelsDVRClient(base_url, session), session
 
 
+def _respond_with(session: MagicMock, data) -> None:
+    session.get.return_value.content = json.dumps(data).encode()
+
+
 # ---------------------------------------------------------------------------
 # get_gracenote
 # ---------------------------------------------------------------------------
@@ -15,7 +20,7 @@ def _client(base_url: str = "http://dvr:8089") -> tuple[ChannelsDVRClient, Magic
 
 def test_get_gracenote_calls_correct_endpoint():
     client, session = _client()
-    session.get.return_value.json.return_value = []
+    _respond_with(session, [])
     client.get_gracenote("GBR-1000193-DEFAULT")
     url = session.get.call_args[0][0]
     assert url == "http://dvr:8089/dvr/guide/stations/GBR-1000193-DEFAULT"
@@ -24,7 +29,7 @@ def test_get_gracenote_calls_correct_endpoint():
 def test_get_gracenote_returns_list():
     client, session = _client()
     data = [{"callSign": "BBC1NWHD", "stationId": "10001"}]
-    session.get.return_value.json.return_value = data
+    _respond_with(session, data)
     result = client.get_gracenote("GBR-1000193-DEFAULT")
     assert result == data
 
@@ -32,7 +37,7 @@ def test_get_gracenote_returns_list():
 def test_get_gracenote_unwraps_outer_list():
     client, session = _client()
     inner = [{"callSign": "BBC1NWHD"}]
-    session.get.return_value.json.return_value = [inner]  # nested
+    _respond_with(session, [inner])  # nested
     result = client.get_gracenote("GBR-1000193-DEFAULT")
     assert result == inner
 
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Channel:
     channel_type: str  # Channel type, e.g., "v", "r", "feed"
     name: str  # Channel name, e.g., "BBC One HD"
@@ -21,7 +21,7 @@ class Channel:
 
     def __str__(self):
         return (
-            f"{self.name} [{self.country}] | {self.genre} by {self.provider} | "
-            f"SID: {self.sid}, VPID: {self.vpid}, APID: {self.apid}, PCR: {self.pcr} | "
+            f"{self.name} [{self.country}] | {self.category} by {', '.join(self.packages)} | "
+            f"SID: {self.sid}, VPID: {self.vpid}, APID: {self.apids}, PCR: {self.pcr} | "
             f"Encryption: {self.encryption} | Last Updated: {self.last_updated.strftime('%Y-%m-%d %H:%M:%S')}"
         )
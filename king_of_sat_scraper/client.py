@@ -1,6 +1,13 @@
+import hashlib
 import logging
+import os
+import tempfile
+import time
+from typing import Optional
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from king_of_sat_scraper import DEFAULT_BASE_URL
 from king_of_sat_scraper.scraper import KingOfSatScraper
@@ -8,24 +15,77 @@ from king_of_sat_scraper.transponder import Transponder
 
 logger = logging.getLogger(__name__)
 
+# Enough keep-alive connections for pipeline step 1 to fetch several
+# positions concurrently without discarding pooled sockets.
+_POOL_SIZE = 16
+
 
 class KingOfSatClient:
     """HTTP client for KingOfSat.
 
     Pass an already-configured requests.Session (useful for testing with a
     mock/stub).  Use KingOfSatClient.create() in production code.
+
+    If cache_dir is set, fetched pages are kept on disk and reused for
+    cache_ttl seconds, so repeated runs skip the network round trip.
     """
 
-    def __init__(self, base_url: str, session: requests.Session):
+    def __init__(
+        self,
+        base_url: str,
+        session: requests.Session,
+        cache_dir: Optional[str] = None,
+        cache_ttl: int = 3600,
+    ):
         self.base_url = base_url.rstrip("?")
         self.session = session
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
 
     @classmethod
-    def create(cls, base_url: str = DEFAULT_BASE_URL) -> "KingOfSatClient":
-        return cls(base_url, requests.Session())
+    def create(
+        cls,
+        base_url: str = DEFAULT_BASE_URL,
+        cache_dir: Optional[str] = None,
+        cache_ttl: int = 3600,
+    ) -> "KingOfSatClient":
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return cls(base_url, session, cache_dir=cache_dir, cache_ttl=cache_ttl)
 
     def _build_url(self, position: str, channel_filter: str, cl: str) -> str:
-        return f"{self.base_url}?pos={position}" f"&standard=All&ordre=freq&filtre={channel_filter}&cl={cl}"
+        query = urlencode({"pos": position, "standard": "All", "ordre": "freq", "filtre": channel_filter, "cl": cl})
+        return f"{self.base_url}?{query}"
+
+    def _cache_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]}.html")
+
+    def _fetch_html(self, url: str) -> str:
+        """GET url, serving it from the on-disk cache when one is configured and fresh."""
+        cache_path = self._cache_path(url) if self.cache_dir else None
+        if cache_path and os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < self.cache_ttl:
+            logger.info(f"Using cached {url}")
+            with open(cache_path, encoding="utf-8") as f:
+                return f.read()
+
+        logger.info(f"Fetching {url}")
+        resp = self.session.get(url, timeout=30)
+        resp.raise_for_status()
+        if cache_path:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a private temp file and rename it into place, so a crash or a
+            # concurrent fetch of the same URL can never leave a truncated page behind.
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with open(fd, "w", encoding="utf-8") as f:
+                    f.write(resp.text)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        return resp.text
 
     def fetch_transponders(
         self,
@@ -44,9 +104,10 @@ class KingOfSatClient:
             List of Transponder objects (empty if parse finds nothing).
         """
         url = self._build_url(position, channel_filter, cl)
-        logger.info(f"Fetching {url}")
-        resp = self.session.get(url, timeout=30)
-        resp.raise_for_status()
-        transponders = KingOfSatScraper(resp.text).parse_transponders()
+        scraper = KingOfSatScraper(self._fetch_html(url))
+        try:
+            transponders = scraper.parse_transponders()
+        finally:
+            scraper.close()
         logger.info(f"{position}: {len(transponders)} transponders")
         return transponders
@@ -1,57 +1,185 @@
 import logging
 import re
 from datetime import datetime
-from typing import List
+from sys import intern
+from typing import Iterator, List, Optional, Tuple, Union
 
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 
 from king_of_sat_scraper.channel import Channel
 from king_of_sat_scraper.transponder import Transponder
 
+# Transponders and channels live in separate tables; each parse builds only those
+_FRQ_ONLY = SoupStrainer("table", class_="frq")
+_FL_ONLY = SoupStrainer("table", class_="fl")
+
+_EXPECTED_HEADERS = (
+    "Pos",
+    "Satellite",
+    "Frequency",
+    "Pol",
+    "Txp",
+    "Coverage area",
+    "Standard",
+    "Modulation",
+    "SR/FEC",
+    "Network, Bitrate",
+    "NID",
+    "TID",
+)
+
+_SYMRATE_FEC = re.compile(r"(\d+)\s+(\d+/\d+)")
+_PID_TAG = re.compile(r"(\d+)\s*([a-zA-Z]+)?")
+_DIGITS = re.compile(r"\d+")
+_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
+def _cell_text(td: Tag) -> str:
+    return td.get_text(strip=True)
+
+
+def _cell_text_or_none(td: Tag) -> Optional[str]:
+    return td.get_text(strip=True) or None
+
+
+def _cell_int(td: Tag) -> int:
+    return int(td.get_text(strip=True))
+
+
+def _cell_int_or_none(td: Tag) -> Optional[int]:
+    text = td.get_text(strip=True)
+    return int(text) if text.isdigit() else None
+
+
+def _cell_channel_type(td: Tag) -> Optional[str]:
+    # The first td's class holds the channel type: "v", "r", "feed", etc.
+    class_attr = td.get("class", [])
+    return class_attr[0] if class_attr else None
+
+
+def _cell_channel_name(td: Tag) -> str:
+    name_tag = td.find("a", class_="A3")
+    return name_tag.get_text(strip=True) if name_tag else td.get_text(strip=True)
+
+
+def _cell_packages(td: Tag) -> List[str]:
+    # Some rows don't have links in packages; the package count varies, so collect them all
+    return [a.get_text(strip=True) for a in td.find_all("a")]
+
+
+def _cell_vpid(td: Tag) -> Optional[int]:
+    vpid_text = td.get_text(strip=True)
+    if vpid_text.isdigit():
+        return int(vpid_text)
+    vpid_match = _DIGITS.search(vpid_text) if vpid_text else None
+    return int(vpid_match.group()) if vpid_match else None
+
+
+def _cell_symbol_rate_fec(td: Tag) -> Tuple[Union[int, float], str]:
+    # Only the first two links (symbol rate, FEC) matter
+    sr_link = td.find("a")
+    if sr_link:
+        fec_link = sr_link.find_next_sibling("a")
+        return int(sr_link.get_text(strip=True)), fec_link.get_text(strip=True) if fec_link else ""
+    # Plain-text fallback, e.g. "27500 5/6"
+    sr_fec_match = _SYMRATE_FEC.search(td.get_text(" ", strip=True))
+    if sr_fec_match:
+        return int(sr_fec_match.group(1)), sr_fec_match.group(2)
+    return 0.0, ""
+
+
+# Fixed channel-table layout: (column index, converter) for the fields before APIDs...
+_CHANNEL_CONVERTERS = (
+    (0, _cell_channel_type),
+    (2, _cell_channel_name),
+    (3, _cell_text_or_none),  # country
+    (4, _cell_text_or_none),  # category
+    (5, _cell_packages),
+    (6, _cell_text),  # encryption
+    (7, _cell_int),  # sid
+    (8, _cell_vpid),
+)
+# ...and the PMT, PCR and teletext PIDs after them
+_CHANNEL_PID_CONVERTERS = (
+    (10, _cell_int_or_none),
+    (11, _cell_int_or_none),
+    (12, _cell_int_or_none),
+)
+
 
 class KingOfSatScraper:
-    def __init__(self, html_content: str):
+    def __init__(self, html_content: Union[str, BeautifulSoup], parser: str = "lxml"):
         """
         Initializes the scraper with HTML content.
-        :param html_content: HTML content as a string
+        :param html_content: HTML content as a string, or an already-parsed BeautifulSoup
+                             tree to share between scrapers (close() leaves it intact)
+        :param parser: BeautifulSoup tree builder; use "html.parser" for pages lxml mangles
         """
-        self.soup = BeautifulSoup(html_content, "html.parser")
-        self.transponders = []
-
-    def _validate_header_table(self) -> bool:
-        expected_columns = [
-            "Pos",
-            "Satellite",
-            "Frequency",
-            "Pol",
-            "Txp",
-            "Coverage area",
-            "Standard",
-            "Modulation",
-            "SR/FEC",
-            "Network, Bitrate",
-            "NID",
-            "TID",
-        ]
-        header_table = self.soup.find("table", class_="frq")
-        if not header_table:
-            logging.error("❌ No header table found.")
-            return False
+        self._parser = parser
+        self._closed = False
+        # Only trees this scraper parsed itself are decomposed on close()
+        self._owns_soup = not isinstance(html_content, BeautifulSoup)
+        if not self._owns_soup:
+            self._html = None
+            self._frq_soup = self._fl_soup = html_content
+        else:
+            # Parsed lazily, and only the tables each parser needs (see _FRQ_ONLY/_FL_ONLY)
+            self._html = html_content
+            self._frq_soup = self._fl_soup = None
+
+    @property
+    def frq_soup(self) -> BeautifulSoup:
+        """Tree holding just the transponder (frq) tables."""
+        if self._closed:
+            raise ValueError("KingOfSatScraper is closed.")
+        if self._frq_soup is None:
+            self._frq_soup = BeautifulSoup(self._html, self._parser, parse_only=_FRQ_ONLY)
+        return self._frq_soup
+
+    @property
+    def fl_soup(self) -> BeautifulSoup:
+        """Tree holding just the channel list (fl) tables."""
+        if self._closed:
+            raise ValueError("KingOfSatScraper is closed.")
+        if self._fl_soup is None:
+            self._fl_soup = BeautifulSoup(self._html, self._parser, parse_only=_FL_ONLY)
+        return self._fl_soup
+
+    def close(self) -> None:
+        """
+        Release the parsed trees so they can be reclaimed before the caller moves on.
+        A caller-supplied tree is only dropped, not decomposed. The scraper cannot
+        parse again after this.
+        """
+        if self._owns_soup:
+            if self._frq_soup is not None:
+                self._frq_soup.decompose()
+            if self._fl_soup is not None:
+                self._fl_soup.decompose()
+        self._html = self._frq_soup = self._fl_soup = None
+        self._closed = True
+
+    def __enter__(self) -> "KingOfSatScraper":
+        return self
 
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _validate_header_table(self, header_table: Tag) -> bool:
         header_row = header_table.find("tr")
         if not header_row:
             logging.error("❌ Header row missing.")
             return False
 
-        actual_columns = [td.get_text(strip=True) for td in header_row.find_all("td")]
-
         # Strip out columns that contain only images or links
-        actual_columns = [
-            col for col in actual_columns if not (col == "" or col.lower() == "[img]" or col.startswith("<a"))
-        ]
-
-        if actual_columns != expected_columns:
-            logging.error("❌ Header columns mismatch.\nExpected: %s\nFound: %s", expected_columns, actual_columns)
+        actual_columns = tuple(
+            col
+            for td in header_row.find_all("td", recursive=False)
+            if (col := td.get_text(strip=True)) and col.lower() != "[img]" and not col.startswith("<a")
+        )
+
+        if actual_columns != _EXPECTED_HEADERS:
+            logging.error("❌ Header columns mismatch.\nExpected: %s\nFound: %s", _EXPECTED_HEADERS, actual_columns)
             return False
 
         logging.info("✅ Header table validated successfully.")
@@ -62,16 +190,27 @@ class KingOfSatScraper:
         Parse transponder information from the HTML content.
         :return: List of Transponder objects
         """
-        if not self._validate_header_table():
+        return list(self.iter_transponders())
+
+    def iter_transponders(self) -> Iterator[Transponder]:
+        """
+        Lazily parse transponder information from the HTML content.
+        :return: Iterator of Transponder objects
+        """
+        # One traversal finds every frq table; the first is the header table
+        tables = self.frq_soup.select("table.frq")
+        if not tables:
+            logging.error("❌ No header table found.")
+            return
+        if not self._validate_header_table(tables[0]):
             logging.error("❌ HTML header structure is invalid. Aborting parse.")
-            return []
+            return
 
-        tables = self.soup.find_all("table", class_="frq")
         if len(tables) <= 1:
             logging.error("❌ No transponder data tables found after header.")
-            return []
+            return
 
-        transponders = []
+        count = 0
 
         for i, table in enumerate(tables[1:], start=1):
             row = table.find("tr")
@@ -79,7 +218,7 @@ class KingOfSatScraper:
                 logging.warning(f"⚠️ Table {i} has no <tr> row.")
                 continue
 
-            cols = row.find_all("td")
+            cols = row.find_all("td", recursive=False)
             if len(cols) < 12:
                 logging.warning(f"⚠️ Skipping malformed transponder table at index {i}.")
                 continue
@@ -97,50 +236,51 @@ class KingOfSatScraper:
                 system = cols[6].get_text(strip=True)
                 mod = cols[7].get_text(strip=True)
 
-                sr_fec_links = cols[8].find_all("a")
-                symbol_rate = int(sr_fec_links[0].get_text(strip=True)) if len(sr_fec_links) > 0 else 0.0
-                fec = sr_fec_links[1].get_text(strip=True) if len(sr_fec_links) > 1 else ""
+                symbol_rate, fec = _cell_symbol_rate_fec(cols[8])
 
                 bitrate = cols[9].get_text(strip=True)
                 nid = int(cols[10].get_text(strip=True))
                 tid = int(cols[11].get_text(strip=True))
 
+                # Low-cardinality fields repeat on every row; intern them so rows share one str each
                 transponder = Transponder(
-                    position=position,
-                    satellite=satellite,
+                    position=intern(position),
+                    satellite=intern(satellite),
                     frequency=freq,
-                    polarization=pol,
+                    polarization=intern(pol),
                     transponder_id=t_id,
-                    beam=beam,
-                    system=system,
-                    modulation=mod,
+                    beam=intern(beam),
+                    system=intern(system),
+                    modulation=intern(mod),
                     symbol_rate=symbol_rate,
-                    fec=fec,
+                    fec=intern(fec),
                     network_bitrate=bitrate,
                     nid=nid,
                     tid=tid,
                 )
 
-                transponders.append(transponder)
-                logging.debug(f"✅ Parsed Transponder {i}: {transponder}")
-
-            except Exception as e:
+            except (ValueError, AttributeError) as e:
                 logging.error(f"❌ Error parsing transponder {i}: {e}")
+            else:
+                # Outside the try so exceptions thrown into the generator aren't swallowed
+                count += 1
+                logging.debug("✅ Parsed Transponder %d: %s", i, transponder)
+                yield transponder
 
-        logging.info(f"🎯 Parsed {len(transponders)} transponders total.")
-        return transponders
+        logging.info(f"🎯 Parsed {count} transponders total.")
 
     def parse_apids(self, apid_cell) -> dict[str, int]:
         apids: dict[str, int] = {}
         raw_apids: List[int] = []
 
         # The cell contains text parts separated by <br> tags.
-        # We iterate over the contents of the cell to avoid re-parsing snippets.
-        for content in apid_cell.contents:
-            if isinstance(content, Tag):
+        # We walk the direct children once to avoid re-parsing snippets;
+        # <br> separators carry no text so they are skipped outright.
+        for content in apid_cell.children:
+            if isinstance(content, NavigableString):
+                text = content.strip()
+            elif isinstance(content, Tag) and content.name != "br":
                 text = content.get_text(strip=True)
-            elif isinstance(content, NavigableString):
-                text = str(content).strip()
             else:
                 continue
 
@@ -148,7 +288,7 @@ class KingOfSatScraper:
                 continue
 
             # Look for "PID [tag]"
-            match = re.search(r"(\d+)\s*([a-zA-Z]+)?", text)
+            match = _PID_TAG.search(text)
             if match:
                 pid = int(match.group(1))
                 tag = match.group(2).lower() if match.group(2) else None
@@ -174,70 +314,46 @@ class KingOfSatScraper:
         return apids
 
     def parse_channels(self) -> List[Channel]:
-        channels = []
-
-        for table in self.soup.find_all("table", class_="fl"):
-            for row in table.find_all("tr", bgcolor="white"):
-                try:
-                    cols = row.find_all("td")
-
-                    # First td holds the channel type (v, a, f, d)
-                    channel_type_td = cols[0]
-                    class_attr = channel_type_td.get("class", [])
-                    # "v", "a", etc.
-                    channel_type = class_attr[0] if class_attr else None
-
-                    name_tag = cols[2].find("a", class_="A3")
-                    name = name_tag.get_text(strip=True) if name_tag else cols[2].get_text(strip=True)
-
-                    country = cols[3].get_text(strip=True) or None
-                    genre = cols[4].get_text(strip=True) or None
-
-                    # Some rows don't have links in packages
-                    packages = []
-                    pkg_links = cols[5].find_all("a")
-                    if pkg_links:
-                        packages = [a.get_text(strip=True) for a in pkg_links]
-
-                    encryption = cols[6].get_text(strip=True)
-                    sid = int(cols[7].get_text(strip=True))
-
-                    # VPID
-                    vpid_text = cols[8].get_text(strip=True)
-                    vpid_match = re.search(r"\d+", vpid_text) if vpid_text else None
-                    vpid = int(vpid_match.group()) if vpid_match else None
-
-                    apids = self.parse_apids(cols[9])
-                    pmt = int(cols[10].get_text(strip=True)) if cols[10].get_text(strip=True).isdigit() else None
-                    pcr = int(cols[11].get_text(strip=True)) if cols[11].get_text(strip=True).isdigit() else None
-                    txt_col = cols[12].get_text(strip=True)
-                    txt = int(txt_col) if txt_col.isdigit() else None
-
-                    # Date
-                    date_str = cols[13].get_text(strip=True)
-                    date_str = re.sub(r"[^0-9-]", "", date_str)
-                    last_updated = datetime.strptime(date_str, "%Y-%m-%d")
-
-                    channel = Channel(
-                        channel_type=channel_type,
-                        name=name,
-                        country=country,
-                        category=genre,
-                        packages=packages,
-                        encryption=encryption,
-                        sid=sid,
-                        vpid=vpid,
-                        apids=apids,
-                        pmt=pmt,
-                        pcr=pcr,
-                        txt=txt,
-                        last_updated=last_updated,
-                    )
-
-                    channels.append(channel)
-
-                except Exception as e:
-                    logging.warning(f"⚠️ Error parsing channel row: {e}. Row content: {row.get_text(strip=True)}")
-
-        logging.info(f"📺 Parsed {len(channels)} channels.")
-        return channels
+        return list(self.iter_channels())
+
+    def iter_channels(self) -> Iterator[Channel]:
+        count = 0
+        parsed_dates: dict[str, datetime] = {}
+
+        def parse_date(td: Tag) -> datetime:
+            # Date, followed by a "+" history link, e.g. "2024-07-10 +"
+            date_str = td.get_text(" ", strip=True).partition(" ")[0]
+            # Many rows share an update date; datetime objects are immutable so reuse them
+            last_updated = parsed_dates.get(date_str)
+            if last_updated is None:
+                date_match = _DATE.fullmatch(date_str)
+                if not date_match:
+                    raise ValueError(f"Invalid date: {date_str!r}")
+                year, month, day = date_match.groups()
+                last_updated = parsed_dates[date_str] = datetime(int(year), int(month), int(day))
+            return last_updated
+
+        # (column index, converter) pairs in Channel field order
+        converters = (
+            *_CHANNEL_CONVERTERS,
+            (9, self.parse_apids),
+            *_CHANNEL_PID_CONVERTERS,
+            (13, parse_date),
+        )
+
+        for row in self.fl_soup.select("table.fl tr[bgcolor=white]"):
+            cols = row.find_all("td", recursive=False)
+            if len(cols) < 14:
+                logging.warning(f"⚠️ Skipping malformed channel row: {row.get_text(strip=True)}")
+                continue
+
+            try:
+                channel = Channel(*[convert(cols[i]) for i, convert in converters])
+            except (ValueError, AttributeError) as e:
+                logging.warning(f"⚠️ Error parsing channel row: {e}. Row content: {row.get_text(strip=True)}")
+                continue
+
+            count += 1
+            yield channel
+
+        logging.info(f"📺 Parsed {count} channels.")
@@ -2,7 +2,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from king_of_sat_scraper.client import KingOfSatClient
+from king_of_sat_scraper.client import _POOL_SIZE, KingOfSatClient
 from king_of_sat_scraper.transponder import Transponder
 
 
@@ -38,6 +38,12 @@ def test_build_url_includes_language():
     assert "cl=fra" in url
 
 
+def test_build_url_encodes_position():
+    client = KingOfSatClient("https://en.kingofsat.net/freqs.php", MagicMock())
+    url = client._build_url("28.2°E", "Clear", "eng")
+    assert "pos=28.2%C2%B0E" in url
+
+
 # ---------------------------------------------------------------------------
 # fetch_transponders
 # ---------------------------------------------------------------------------
@@ -72,7 +78,45 @@ def test_fetch_transponders_returns_parsed_list():
     assert result == [fake_transponder]
 
 
+def test_fetch_transponders_reuses_cached_html(tmp_path):
+    session = _mock_session()
+    client = KingOfSatClient("https://en.kingofsat.net/freqs.php", session, cache_dir=str(tmp_path))
+    with patch("king_of_sat_scraper.client.KingOfSatScraper") as mock_scraper:
+        mock_scraper.return_value.parse_transponders.return_value = []
+        client.fetch_transponders("28.2E")
+        client.fetch_transponders("28.2E")
+    assert session.get.call_count == 1
+    assert mock_scraper.call_args[0][0] == "<html></html>"
+
+
+def test_fetch_transponders_cache_write_leaves_no_temp_files(tmp_path):
+    session = _mock_session()
+    client = KingOfSatClient("https://en.kingofsat.net/freqs.php", session, cache_dir=str(tmp_path))
+    with patch("king_of_sat_scraper.client.KingOfSatScraper") as mock_scraper:
+        mock_scraper.return_value.parse_transponders.return_value = []
+        client.fetch_transponders("28.2E")
+    assert [p.suffix for p in tmp_path.iterdir()] == [".html"]
+
+
+def test_fetch_transponders_refetches_when_cache_expired(tmp_path):
+    session = _mock_session()
+    client = KingOfSatClient("https://en.kingofsat.net/freqs.php", session, cache_dir=str(tmp_path), cache_ttl=0)
+    with patch("king_of_sat_scraper.client.KingOfSatScraper") as mock_scraper:
+        mock_scraper.return_value.parse_transponders.return_value = []
+        client.fetch_transponders("28.2E")
+        client.fetch_transponders("28.2E")
+    assert session.get.call_count == 2
+
+
 def test_create_classmethod_returns_client_instance():
     client = KingOfSatClient.create()
     assert isinstance(client, KingOfSatClient)
     assert "kingofsat" in client.base_url
+
+
+def test_create_classmethod_mounts_pooled_adapter():
+    with patch("king_of_sat_scraper.client.HTTPAdapter") as mock_adapter:
+        client = KingOfSatClient.create()
+    mock_adapter.assert_called_once_with(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+    assert client.session.get_adapter("https://en.kingofsat.net/freqs.php") is mock_adapter.return_value
+    assert client.session.get_adapter("http://en.kingofsat.net/freqs.php") is mock_adapter.return_value
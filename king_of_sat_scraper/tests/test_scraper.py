@@ -1,9 +1,10 @@
+import functools
 import logging
-import os
 import unittest
 from datetime import datetime
+from pathlib import Path
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from king_of_sat_scraper.scraper import KingOfSatScraper
 
@@ -29,51 +30,92 @@ VALID_HEADER_HTML = """
     """
 
 
-class TestValidateHeaderTable(unittest.TestCase):
+@functools.lru_cache(maxsize=1)
+def _load_astra_html() -> str:
+    """
+    Load the Astra 28.2°E KingOfSat page from the resources directory, once per test run.
+    """
+    html_file_path = (
+        Path(__file__).resolve().parent
+        / "resources"
+        / "Astra 2E _ Astra 2F _ Astra 2G (28.2°E) - All transmissions - frequencies - KingOfSat.html"
+    )
+
+    if not html_file_path.exists():
+        raise FileNotFoundError(f"Test HTML file not found: {html_file_path}")
+
+    return html_file_path.read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def _astra_scraper() -> KingOfSatScraper:
+    """
+    Shared scraper over the unmodified Astra page for tests that only read it.
+    """
+    return KingOfSatScraper(_load_astra_html())
+
+
+def _validate_header(scraper: KingOfSatScraper) -> bool:
+    return scraper._validate_header_table(scraper.frq_soup.find("table", class_="frq"))
+
+
+class _AstraPageTestCase(unittest.TestCase):
     @classmethod
-    def load_html_content(cls):
-        """
-        Helper function to load HTML content from a file in the resources directory for testing.
-        """
-        # Get the absolute path of the current test file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        # Construct the path to the resources directory
-        resources_dir = os.path.join(current_dir, "resources")
-        # Construct the full path to the HTML file
-        html_file_path = os.path.join(
-            resources_dir, "Astra 2E _ Astra 2F _ Astra 2G (28.2°E) - All transmissions - frequencies - KingOfSat.html"
-        )
+    def setUpClass(cls):
+        # Read and parse the page once; tests that don't mutate it share the scraper
+        cls._html = _load_astra_html()
+        cls._scraper = _astra_scraper()
 
-        if not os.path.exists(html_file_path):
-            raise FileNotFoundError(f"Test HTML file not found: {html_file_path}")
 
-        with open(html_file_path, "r", encoding="utf-8") as file:
-            return file.read()
+class TestValidateHeaderTable(_AstraPageTestCase):
+    def header_soup(self):
+        """
+        Parse just the frq tables of the cached page, for tests that mutate the header tree.
+        """
+        return BeautifulSoup(self._html, "lxml", parse_only=SoupStrainer("table", class_="frq"))
 
     def test_valid_header_table(self):
         """
         Test if the header table is correctly validated with valid headers.
         """
-        html_content = self.load_html_content()
-        scraper = KingOfSatScraper(html_content)
+        scraper = self._scraper
 
         # Validating the header table
-        is_valid = scraper._validate_header_table()
+        is_valid = _validate_header(scraper)
 
         self.assertTrue(is_valid, "The header table should be valid with the correct column names.")
 
+    def test_accepts_parsed_soup(self):
+        """
+        A pre-parsed BeautifulSoup tree is used as-is rather than re-parsed.
+        """
+        soup = BeautifulSoup(self._html, "lxml")
+        scraper = KingOfSatScraper(soup)
+        self.assertIs(scraper.frq_soup, soup)
+        self.assertIs(scraper.fl_soup, soup)
+        self.assertTrue(_validate_header(scraper))
+
+    def test_trees_only_contain_their_tables(self):
+        """
+        The lazily built trees are restricted to the transponder and channel tables.
+        """
+        scraper = KingOfSatScraper(self._html)
+        self.assertIsNone(scraper.frq_soup.find("table", class_="fl"))
+        self.assertIsNone(scraper.fl_soup.find("table", class_="frq"))
+        self.assertIsNone(scraper.frq_soup.find("head"))
+
     def test_missing_column_in_header(self):
         """
         Test the edge case where a column is missing from the header table.
         """
-        html_content = self.load_html_content()
+        soup = self.header_soup()
 
         # Simulate missing column (removing one column from the header)
-        html_content_invalid = html_content.replace('<td class="pos" dir="ltr">Pos</td>', "")
-        scraper = KingOfSatScraper(html_content_invalid)
+        soup.select_one("table.frq tr td.pos").decompose()
+        scraper = KingOfSatScraper(soup)
 
         # Validating the header table
-        is_valid = scraper._validate_header_table()
+        is_valid = _validate_header(scraper)
 
         self.assertFalse(is_valid, "The header table should be invalid if a column is missing.")
 
@@ -81,14 +123,14 @@ class TestValidateHeaderTable(unittest.TestCase):
         """
         Test the edge case where an extra column is added to the header table.
         """
-        html_content = self.load_html_content()
+        html_content = self._html
 
         # Simulate extra column (adding a column to the header)
         html_content_invalid = html_content.replace("</tr></table>", "<td>Extra Column</td></tr></table>")
         scraper = KingOfSatScraper(html_content_invalid)
 
         # Validating the header table
-        is_valid = scraper._validate_header_table()
+        is_valid = _validate_header(scraper)
 
         self.assertFalse(is_valid, "The header table should be invalid if there is an extra column.")
 
@@ -96,16 +138,15 @@ class TestValidateHeaderTable(unittest.TestCase):
         """
         Test the edge case where the column order in the header is incorrect.
         """
-        html_content = self.load_html_content()
+        soup = self.header_soup()
 
         # Simulate incorrect column order (e.g., switch 'Pos' and 'Satellite')
-        html_content_invalid = html_content.replace(
-            '<td class="pos" dir="ltr">Pos</td>', '<td class="pos" dir="ltr">Satellite</td>'
-        ).replace('<td width="20%">Satellite</td>', '<td width="20%">Pos</td>')
-        scraper = KingOfSatScraper(html_content_invalid)
+        pos_td, satellite_td = soup.select_one("table.frq tr").find_all("td", limit=2)
+        pos_td.string, satellite_td.string = "Satellite", "Pos"
+        scraper = KingOfSatScraper(soup)
 
         # Validating the header table
-        is_valid = scraper._validate_header_table()
+        is_valid = _validate_header(scraper)
 
         self.assertFalse(is_valid, "The header table should be invalid if the column order is incorrect.")
 
@@ -113,45 +154,24 @@ class TestValidateHeaderTable(unittest.TestCase):
         """
         Test if the header table can be validated when there are special characters or unusual content.
         """
-        html_content = self.load_html_content()
+        html_content = self._html
 
         # Simulate a special character or strange formatting in the header
         html_content_invalid = html_content.replace("Pos", "Pos ☃️")
         scraper = KingOfSatScraper(html_content_invalid)
 
         # Validating the header table
-        is_valid = scraper._validate_header_table()
+        is_valid = _validate_header(scraper)
 
         self.assertFalse(is_valid, "The header table should be invalid if the column name contains special characters.")
 
 
-class TestParseTransponders(unittest.TestCase):
-    @classmethod
-    def load_html_content(cls):
-        """
-        Helper function to load HTML content from a file in the resources directory for testing.
-        """
-        # Get the absolute path of the current test file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        # Construct the path to the resources directory
-        resources_dir = os.path.join(current_dir, "resources")
-        # Construct the full path to the HTML file
-        html_file_path = os.path.join(
-            resources_dir, "Astra 2E _ Astra 2F _ Astra 2G (28.2°E) - All transmissions - frequencies - KingOfSat.html"
-        )
-
-        if not os.path.exists(html_file_path):
-            raise FileNotFoundError(f"Test HTML file not found: {html_file_path}")
-
-        with open(html_file_path, "r", encoding="utf-8") as file:
-            return file.read()
-
+class TestParseTransponders(_AstraPageTestCase):
     def test_parse_transponders(self):
         """
         Test the parse_transponders method with the actual HTML file.
         """
-        html_content = self.load_html_content()
-        scraper = KingOfSatScraper(html_content)
+        scraper = self._scraper
         transponders = scraper.parse_transponders()
 
         # Validate that transponders are parsed correctly
@@ -189,6 +209,51 @@ class TestParseTransponders(unittest.TestCase):
         assert last_transponder.nid == 2
         assert last_transponder.tid == 2035
 
+    def test_iter_transponders_matches_parse_transponders(self):
+        """
+        iter_transponders yields the same transponders parse_transponders returns.
+        """
+        scraper = self._scraper
+        self.assertEqual(list(scraper.iter_transponders()), scraper.parse_transponders())
+
+    def test_iter_transponders_propagates_thrown_exceptions(self):
+        """
+        Exceptions thrown into the generator are not mistaken for row parse errors.
+        """
+        transponders = self._scraper.iter_transponders()
+        next(transponders)
+        with self.assertRaises(ValueError):
+            transponders.throw(ValueError("thrown by caller"))
+
+    def test_iter_transponders_without_header_table(self):
+        """
+        A page with no frq tables yields nothing instead of failing.
+        """
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertEqual(list(KingOfSatScraper("<html></html>").iter_transponders()), [])
+        self.assertIn("No header table found", logs.output[0])
+
+    def test_context_manager_closes_scraper(self):
+        """
+        Leaving the with-block releases the parsed trees; the scraper can't parse afterwards.
+        """
+        with KingOfSatScraper(VALID_HEADER_HTML) as scraper:
+            scraper.parse_transponders()
+        with self.assertRaises(ValueError):
+            scraper.parse_transponders()
+        with self.assertRaises(ValueError):
+            scraper.parse_channels()
+
+    def test_close_leaves_shared_soup_intact(self):
+        """
+        Closing one scraper doesn't break another sharing the same caller-supplied tree.
+        """
+        soup = BeautifulSoup(VALID_HEADER_HTML, "lxml")
+        with KingOfSatScraper(soup) as first:
+            first.parse_transponders()
+        self.assertIsNotNone(soup.find("table", class_="frq"))
+        self.assertTrue(_validate_header(KingOfSatScraper(soup)))
+
     def test_parse_transponder_with_missing_fields(self):
         """
         Test parser behavior when a transponder row is missing fields.
@@ -278,8 +343,9 @@ class TestParseTransponders(unittest.TestCase):
         scraper = KingOfSatScraper(html_snippet)
         transponders = scraper.parse_transponders()
         self.assertEqual(len(transponders), 1)
-        # Since <a> not used, fallback
-        self.assertEqual(transponders[0].symbol_rate, 0.0)
+        # Since <a> not used, fall back to parsing the cell text
+        self.assertEqual(transponders[0].symbol_rate, 27500)
+        self.assertEqual(transponders[0].fec, "5/6")
 
     def test_parse_transponder_with_extra_columns(self):
         """
@@ -330,6 +396,8 @@ class TestParseApids(unittest.TestCase):
 
     def make_apid_cell(self, html: str):
         """Helper to create a BeautifulSoup tag from HTML string."""
+        # html.parser keeps the fragment's nodes as top-level children; lxml would
+        # wrap them in <html><body><p>, hiding them from parse_apids' child walk.
         return BeautifulSoup(html, "html.parser")
 
     def test_single_apid_with_lang(self):
@@ -370,33 +438,12 @@ class TestParseApids(unittest.TestCase):
         self.assertEqual(apids, {"eng": 5101, "nar": 5105})
 
 
-class TestParseChannels(unittest.TestCase):
-    @classmethod
-    def load_html_content(cls):
-        """
-        Helper function to load HTML content from a file in the resources directory for testing.
-        """
-        # Get the absolute path of the current test file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        # Construct the path to the resources directory
-        resources_dir = os.path.join(current_dir, "resources")
-        # Construct the full path to the HTML file
-        html_file_path = os.path.join(
-            resources_dir, "Astra 2E _ Astra 2F _ Astra 2G (28.2°E) - All transmissions - frequencies - KingOfSat.html"
-        )
-
-        if not os.path.exists(html_file_path):
-            raise FileNotFoundError(f"Test HTML file not found: {html_file_path}")
-
-        with open(html_file_path, "r", encoding="utf-8") as file:
-            return file.read()
-
+class TestParseChannels(_AstraPageTestCase):
     def test_parse_channels(self):
         """
         Test the parse_channels method with the actual HTML file.
         """
-        html_content = self.load_html_content()
-        scraper = KingOfSatScraper(html_content)
+        scraper = self._scraper
         channels = scraper.parse_channels()
 
         # Validate that channels are parsed correctly
@@ -494,6 +541,18 @@ class TestParseChannels(unittest.TestCase):
         self.assertIsNone(channel.category)
         self.assertEqual(channel.txt, None)
 
+    def test_channel_str(self):
+        """
+        Ensure Channel.__str__ only references fields the dataclass defines.
+        """
+        channel = self._scraper.parse_channels()[0]
+        self.assertEqual(
+            str(channel),
+            "BBC Parliament HD [United Kingdom] | Politics by Sky Digital | "
+            "SID: 6308, VPID: 5400, APID: {'eng': 5401}, PCR: 5400 | "
+            "Encryption: Clear | Last Updated: 2023-02-21 00:00:00",
+        )
+
     def test_parse_channel_with_multiple_packages(self):
         html = """
         <table class="fl">
@@ -576,6 +635,22 @@ class TestParseChannels(unittest.TestCase):
             self.assertEqual(len(channels), 0)
             self.assertTrue(any("Error parsing channel row" in message for message in log.output))
 
+    def test_parse_channel_with_missing_columns(self):
+        html = """
+        <table class="fl">
+            <tr bgcolor="white">
+                <td class="v px3"></td>
+                <td><img src="/zap.gif"></td>
+                <td class="ch">Short Row TV</td>
+            </tr>
+        </table>
+        """
+        scraper = KingOfSatScraper(html)
+        with self.assertLogs(level="WARNING") as log:
+            channels = scraper.parse_channels()
+            self.assertEqual(len(channels), 0)
+            self.assertTrue(any("Skipping malformed channel row" in message for message in log.output))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,49 @@
+import dataclasses
+
+import pytest
+
+from king_of_sat_scraper.transponder import Transponder
+
+
+def _transponder(polarization: str = "H") -> Transponder:
+    return Transponder(
+        position="28.2°E",
+        satellite="Astra 2E",
+        frequency=10773.0,
+        polarization=polarization,
+        transponder_id=45,
+        beam="U.K.",
+        system="DVB-S2",
+        modulation="8PSK",
+        symbol_rate=23000,
+        fec="3/4",
+        network_bitrate="50.1 Mb/s",
+        nid=2,
+        tid=2045,
+    )
+
+
+def test_transponder_keeps_canonical_polarization():
+    assert _transponder("H").polarization == "H"
+
+
+def test_transponder_normalises_lowercase_polarization():
+    assert _transponder("v").polarization == "V"
+
+
+def test_transponder_rejects_invalid_polarization():
+    with pytest.raises(ValueError, match="Invalid polarization: x"):
+        _transponder("x")
+
+
+def test_transponder_is_frozen():
+    transponder = _transponder()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        transponder.polarization = "V"
+
+
+def test_transponder_uses_slots():
+    transponder = _transponder()
+    assert not hasattr(transponder, "__dict__")
+    with pytest.raises((AttributeError, TypeError)):
+        object.__setattr__(transponder, "unexpected", 1)
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 
+_VALID_POLARIZATIONS = frozenset(("H", "V"))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Transponder:
     position: str  # e.g., "28.2°E"
     satellite: str  # e.g., "Astra 2E"
@@ -18,7 +20,10 @@ class Transponder:
     tid: int  # Transport Stream ID, e.g., 2045
 
     def __post_init__(self):
-        valid_polarizations = {"H", "V"}
-        if self.polarization.upper() not in valid_polarizations:
+        if self.polarization in _VALID_POLARIZATIONS:
+            return  # already canonical, the common case
+        polarization = self.polarization.upper()
+        if polarization not in _VALID_POLARIZATIONS:
             raise ValueError(f"Invalid polarization: {self.polarization}. Must be 'H' or 'V'.")
-        self.polarization = self.polarization.upper()
+        # Frozen dataclass: normalise in place via object.__setattr__
+        object.__setattr__(self, "polarization", polarization)
@@ -4,13 +4,19 @@ These functions operate entirely on in-memory data so they are easy to unit
 test.  File loading and CLI wiring live in m3u/scripts/enrich_m3u.py.
 """
 
+import io
 import logging
 import re
-from typing import NamedTuple
+from sys import intern
+from typing import NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
 
+# Sentinel distinguishing "no explicit override" from "override to an unknown callsign"
+_NO_OVERRIDE = object()
+
+
 class EnrichmentResult(NamedTuple):
     text: str
     enriched: int
@@ -45,12 +51,14 @@ def build_gracenote_lookups(data: list[dict]) -> GracenoteLookups:
     callsign_to_info: dict[str, dict[str, str]] = {}
     name_to_callsign: dict[str, str] = {}
     for entry in data:
-        callsign = entry.get("callSign", "").strip()
-        name = entry.get("name", "").strip()
-        station_id = entry.get("stationId", "").strip()
-        channel_num = entry.get("channel", "").strip()
+        # Missing and null fields both become "" (CPython's shared empty string);
+        # callsigns are interned so explicit-override callsigns match by identity.
+        callsign = intern((entry.get("callSign") or "").strip())
         if not callsign:
             continue
+        name = (entry.get("name") or "").strip()
+        station_id = (entry.get("stationId") or "").strip()
+        channel_num = (entry.get("channel") or "").strip()
         callsign_to_info[callsign] = {
             "channel": channel_num,
             "stationId": station_id,
@@ -62,6 +70,34 @@ def build_gracenote_lookups(data: list[dict]) -> GracenoteLookups:
     return GracenoteLookups(callsign_to_info=callsign_to_info, name_to_callsign=name_to_callsign)
 
 
+def _extinf_head(callsign: str, info: dict[str, str]) -> tuple[str, bool]:
+    """Pre-format the label-independent start of an enriched EXTINF line.
+
+    Returns (head, named).  When Gracenote has a display name the head runs up
+    to the comma and the line is ``head + label``; otherwise it stops inside
+    tvg-name, which falls back to the label.
+    """
+    head = f'#EXTINF:-1 channel-id="{callsign}" tvc-guide-stationid="{info["stationId"]}" tvg-name="'
+    if info["name"]:
+        return f'{head}{info["name"]}",', True
+    return head, False
+
+
+def _cached_head(
+    callsign: str, callsign_to_info: dict[str, dict[str, str]], heads: dict[str, tuple[str, bool]]
+) -> Optional[tuple[str, bool]]:
+    """Return the memoised EXTINF head for callsign, or None if Gracenote doesn't know it."""
+    # EAFP: after the first record per callsign nearly every probe is a hit
+    try:
+        return heads[callsign]
+    except KeyError:
+        info = callsign_to_info.get(callsign)
+        if info is None:
+            return None
+        head = heads[callsign] = _extinf_head(callsign, info)
+        return head
+
+
 def enrich_m3u_text(
     m3u_text: str,
     explicit_mappings: dict[str, str],
@@ -87,45 +123,50 @@ def enrich_m3u_text(
     Returns:
         EnrichmentResult(text, enriched_count, skipped_count)
     """
-    explicit_lower = {k.lower(): v for k, v in explicit_mappings.items()}
-    lines = m3u_text.splitlines()
-    output = ["#EXTM3U"]
+    callsign_to_info = lookups.callsign_to_info
+    name_to_callsign = lookups.name_to_callsign
+    # EXTINF heads are formatted once per callsign rather than once per line.
+    heads: dict[str, tuple[str, bool]] = {}
+    # Resolve explicit overrides once: label → EXTINF head, or None when the
+    # override names a callsign Gracenote doesn't know (the channel is skipped).
+    explicit_lower: dict[str, Optional[tuple[str, bool]]] = {
+        label.lower(): _cached_head(cs, callsign_to_info, heads) for label, cs in explicit_mappings.items() if cs
+    }
+    # Walk the playlist lazily rather than materialising a list of lines;
+    # newline=None also folds \r\n and \r endings into \n.
+    lines = io.StringIO(m3u_text, newline=None)
+    # Output is kept as fragments (newlines included) and joined once at the end,
+    # so no per-record line strings are built.
+    output = ["#EXTM3U\n"]
     enriched = skipped = 0
     skipped_channels: list[str] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    for line in lines:
+        line = line.strip()
         if line.startswith("#EXTINF:"):
-            channel_label = line.split(",", 1)[1].strip()
-            stream_url = lines[i + 1].strip() if i + 1 < len(lines) else ""
+            # partition tolerates a missing comma (empty label) where split()[1] would raise
+            channel_label = line.partition(",")[2].strip()
+            stream_url = next(lines, "").strip()
 
-            callsign = explicit_lower.get(channel_label.lower())
-            if not callsign:
-                callsign = lookups.name_to_callsign.get(normalize_name(channel_label))
+            match = explicit_lower.get(channel_label.lower(), _NO_OVERRIDE)
+            if match is _NO_OVERRIDE:
+                callsign = name_to_callsign.get(normalize_name(channel_label))
+                match = _cached_head(callsign, callsign_to_info, heads) if callsign is not None else None
 
-            if callsign is None or callsign not in lookups.callsign_to_info:
-                logger.debug(f"No Gracenote match for: {channel_label!r}")
+            if match is None:
+                logger.debug("No Gracenote match for: %r", channel_label)
                 skipped_channels.append(channel_label)
                 skipped += 1
-                i += 2
                 continue
 
-            # callsign is now guaranteed to be a str and present in callsign_to_info
-            info = lookups.callsign_to_info[callsign]
-            display_name = info["name"] or channel_label
-            output.append(
-                f'#EXTINF:-1 channel-id="{callsign}" '
-                f'tvc-guide-stationid="{info["stationId"]}" '
-                f'tvg-name="{display_name}",{channel_label}'
-            )
-            output.append(stream_url)
+            head, named = match
+            if named:
+                output.extend((head, channel_label, "\n", stream_url, "\n"))
+            else:
+                output.extend((head, channel_label, '",', channel_label, "\n", stream_url, "\n"))
             enriched += 1
-            i += 2
-        else:
-            i += 1
 
     return EnrichmentResult(
-        text="\n".join(output) + "\n",
+        text="".join(output),
         enriched=enriched,
         skipped=skipped,
         skipped_channels=skipped_channels,
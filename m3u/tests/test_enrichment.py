@@ -69,6 +69,11 @@ def test_build_gracenote_lookups_empty_data():
     assert lookups.name_to_callsign == {}
 
 
+def test_build_gracenote_lookups_null_fields():
+    lookups = build_gracenote_lookups([{"callSign": "BBCR4", "stationId": "10003", "name": None, "channel": None}])
+    assert lookups.callsign_to_info == {"BBCR4": {"channel": "", "stationId": "10003", "name": ""}}
+
+
 # ---------------------------------------------------------------------------
 # enrich_m3u_text
 # ---------------------------------------------------------------------------
@@ -153,3 +158,24 @@ def test_enrich_m3u_text_skipped_channels_empty_when_all_matched(lookups):
     explicit = {"UNKNOWNCHANNEL": "ITV1GHD", "BBCWAVE": "BBC1NWHD"}
     result = enrich_m3u_text(M3U_INPUT, explicit, lookups)
     assert result.skipped_channels == []
+
+
+def test_enrich_m3u_text_handles_crlf_line_endings(lookups):
+    result = enrich_m3u_text(M3U_INPUT.replace("\n", "\r\n"), {}, lookups)
+    assert result.enriched == 2
+    assert "rtsp://192.168.1.1:554/?freq=10773\n" in result.text
+
+
+def test_enrich_m3u_text_explicit_mapping_to_unknown_callsign_is_skipped(lookups):
+    explicit = {"BBC1NWHD": "NOTINGRACENOTE"}
+    result = enrich_m3u_text(M3U_INPUT, explicit, lookups)
+    assert "BBC1NWHD" in result.skipped_channels
+    assert result.enriched == 1
+
+
+def test_enrich_m3u_text_falls_back_to_label_for_tvg_name():
+    lookups = build_gracenote_lookups([{"callSign": "BBCR4", "stationId": "10003", "name": "", "channel": ""}])
+    result = enrich_m3u_text("#EXTINF:-1,BBCR4\nrtsp://x\n", {}, lookups)
+    assert result.text == (
+        '#EXTM3U\n#EXTINF:-1 channel-id="BBCR4" tvc-guide-stationid="10003" tvg-name="BBCR4",BBCR4\nrtsp://x\n'
+    )
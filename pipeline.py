@@ -31,14 +31,21 @@ Examples:
 """
 
 import argparse
+import io
 import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 import urllib3
 
+try:
+    import orjson
+except ImportError:  # optional: faster state-file (de)serialisation
+    orjson = None
+
 from channels_dvr.client import ChannelsDVRClient
 from king_of_sat_scraper.client import KingOfSatClient
 from m3u.enrichment import build_gracenote_lookups, enrich_m3u_text
@@ -62,6 +69,8 @@ logger = logging.getLogger(__name__)
 
 ALL_STEPS = list(range(1, 9))
 
+_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
 # ---------------------------------------------------------------------------
 # State helpers — each step persists its output so individual steps can be
 # re-run without repeating earlier ones.
@@ -74,16 +83,31 @@ def _state_path(state_dir: str, key: str, text: bool = False) -> str:
 
 def save_state(state_dir: str, key: str, data, text: bool = False) -> None:
     os.makedirs(state_dir, exist_ok=True)
-    with open(_state_path(state_dir, key, text), "w", encoding="utf-8") as f:
-        f.write(data if text else json.dumps(data, indent=2))
+    path = _state_path(state_dir, key, text)
+    if text:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data)
+    elif orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        # Stream straight to the file rather than building the string first.
+        # json.dump issues one small write per token, so give it a large buffer.
+        with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            json.dump(data, f, indent=2)
 
 
 def load_state(state_dir: str, key: str, text: bool = False):
     path = _state_path(state_dir, key, text)
     if not os.path.exists(path):
         raise StateError(f"State file not found: {path}\n   Run earlier steps first.")
-    with open(path, encoding="utf-8") as f:
-        return f.read() if text else json.load(f)
+    if text:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    # Read bytes so orjson (or json.loads) can decode without a str round-trip
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 # ---------------------------------------------------------------------------
@@ -116,7 +140,11 @@ def _channels_dvr(args) -> ChannelsDVRClient:
 
 
 def _king_of_sat(args) -> KingOfSatClient:
-    return KingOfSatClient.create(base_url=args.kos_base_url)
+    return KingOfSatClient.create(
+        base_url=args.kos_base_url,
+        cache_dir=args.kos_cache_dir,
+        cache_ttl=args.kos_cache_ttl,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -128,10 +156,18 @@ def step_1(args, state: dict) -> None:
     """Scrape transponders from KingOfSat."""
     logger.info("▶  Step 1: Scraping transponders from KingOfSat")
     client = state.setdefault("king_of_sat", _king_of_sat(args))
+    # Positions are independent pages, so fetch them concurrently; results are
+    # still consumed in --positions order (repeats included) to keep the payload
+    # deterministic and identical to a sequential run.
+    with ThreadPoolExecutor(max_workers=max(1, min(args.kos_workers, len(args.positions)))) as pool:
+        futures = [
+            (pos, pool.submit(client.fetch_transponders, pos, channel_filter=args.kos_filter, cl=args.kos_cl))
+            for pos in args.positions
+        ]
     sources = []
-    for pos in args.positions:
+    for pos, future in futures:
         try:
-            transponders = client.fetch_transponders(pos, channel_filter=args.kos_filter, cl=args.kos_cl)
+            transponders = future.result()
         except Exception as exc:
             logger.error(f"Failed to fetch transponders for {pos}: {exc}")
             continue
@@ -251,25 +287,24 @@ def _split_m3u(m3u_text: str, dms_channels: list[dict]) -> tuple[str, str]:
     """
     # Parse all M3U entries keyed by channel label
     entries: dict[str, tuple[str, str]] = {}
-    lines = m3u_text.splitlines()
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    lines = io.StringIO(m3u_text, newline=None)
+    for line in lines:
+        # Cheap substring test first so only EXTINF lines pay for strip()
+        if "#EXTINF:" not in line:
+            continue
+        line = line.strip()
         if line.startswith("#EXTINF:"):
-            label = line.split(",", 1)[1].strip()
-            url = lines[i + 1].strip() if i + 1 < len(lines) else ""
+            label = line.partition(",")[2].strip()
+            url = next(lines, "").strip()
             entries[label] = (line, url)
-            i += 2
-        else:
-            i += 1
 
     tv_lines = ["#EXTM3U"]
     radio_lines = ["#EXTM3U"]
     for ch in dms_channels:
-        name = ch.get("name", "")
-        if name not in entries:
+        entry = entries.get(ch.get("name", ""))
+        if entry is None:
             continue
-        extinf, url = entries[name]
+        extinf, url = entry
         if ch.get("type") == "audio":
             radio_lines.extend([extinf, url])
         else:
@@ -401,6 +436,26 @@ def build_parser() -> argparse.ArgumentParser:
         "--kos-filter", default="Clear", metavar="FILTER", help="Clear (FTA only), All, or Encrypted (default: Clear)"
     )
     g.add_argument("--kos-cl", default="eng", metavar="LANG", help="Channel language filter (default: eng)")
+    g.add_argument(
+        "--kos-workers",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Maximum number of positions to fetch concurrently (default: 4)",
+    )
+    g.add_argument(
+        "--kos-cache-dir",
+        default=None,
+        metavar="DIR",
+        help="Cache fetched KingOfSat pages in DIR and reuse them on later runs (default: no cache)",
+    )
+    g.add_argument(
+        "--kos-cache-ttl",
+        type=int,
+        default=3600,
+        metavar="SEC",
+        help="Seconds a cached KingOfSat page stays valid; 0 forces a refetch (default: 3600)",
+    )
     g.add_argument(
         "--kos-base-url", default="https://en.kingofsat.net/freqs.php", metavar="URL", help=argparse.SUPPRESS
     )
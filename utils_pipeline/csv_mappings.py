@@ -3,6 +3,7 @@
 import csv
 import logging
 from pathlib import Path
+from sys import intern
 
 import m3u
 
@@ -46,8 +47,11 @@ def load_csv_mappings(path: str) -> dict[str, str]:
         except (ValueError, StopIteration):
             logger.warning(f"Invalid CSV headers in {path}, expected Name,Callsign")
             return mappings
-        for row in reader:
-            if len(row) > max(name_idx, callsign_idx):
-                mappings[row[name_idx].strip()] = row[callsign_idx].strip()
+        min_len = max(name_idx, callsign_idx) + 1
+        # Interned callsigns share one object per station and hit the (also
+        # interned) Gracenote lookup keys by identity.
+        mappings.update(
+            (row[name_idx].strip(), intern(row[callsign_idx].strip())) for row in reader if len(row) >= min_len
+        )
     logger.info(f"Loaded {len(mappings)} channel mappings from {path}")
     return mappings
@@ -32,3 +32,44 @@ def test_load_csv_mappings_missing_file():
         raise AssertionError("Should have raised FileNotFoundError")
     except FileNotFoundError:
         pass
+
+
+def test_load_csv_mappings_reordered_columns_and_short_rows(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    with open(csv_file, "w", encoding="utf-8") as f:
+        f.write("Callsign,Notes,Name\n")
+        f.write("BBC1HD.gb,x, BBC One HD \n")
+        f.write("ITV1HD.gb\n")
+
+    mappings = load_csv_mappings(str(csv_file))
+    assert mappings == {"BBC One HD": "BBC1HD.gb"}
+
+
+def test_load_csv_mappings_quoted_name_with_comma(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    with open(csv_file, "w", encoding="utf-8") as f:
+        f.write("Name,Callsign\r\n")
+        f.write('"Sky Sports, Main Event",SKYSPME\r\n')
+        f.write("ITV HD,ITV1HD.gb\r\n")
+
+    mappings = load_csv_mappings(str(csv_file))
+    assert mappings == {"Sky Sports, Main Event": "SKYSPME", "ITV HD": "ITV1HD.gb"}
+
+
+def test_load_csv_mappings_quoted_name_spanning_lines(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    with open(csv_file, "w", encoding="utf-8", newline="") as f:
+        f.write('Name,Callsign\n"multi\nline",Q\n')
+
+    mappings = load_csv_mappings(str(csv_file))
+    assert mappings == {"multi\nline": "Q"}
+
+
+def test_load_csv_mappings_keeps_form_feed_inside_name(tmp_path):
+    # Only \n and \r\n end a row; a form feed inside a name stays part of the field
+    csv_file = tmp_path / "test.csv"
+    with open(csv_file, "w", encoding="utf-8", newline="") as f:
+        f.write("Name,Callsign\nA\x0cB,C\n")
+
+    mappings = load_csv_mappings(str(csv_file))
+    assert mappings == {"A\x0cB": "C"}
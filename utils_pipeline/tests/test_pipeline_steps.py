@@ -0,0 +1,76 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import pipeline
+from king_of_sat_scraper.transponder import Transponder
+from utils_pipeline import StepError
+
+
+def _transponder(satellite: str) -> Transponder:
+    return Transponder(
+        position="28.2°E",
+        satellite=satellite,
+        frequency=10773.0,
+        polarization="H",
+        transponder_id=45,
+        beam="U.K.",
+        system="DVB-S2",
+        modulation="8PSK",
+        symbol_rate=23000,
+        fec="3/4",
+        network_bitrate="50.1 Mb/s",
+        nid=2,
+        tid=2045,
+    )
+
+
+class _StubKingOfSat:
+    """Returns one transponder per position; earlier positions answer last to shuffle completion order."""
+
+    def __init__(self, positions: list[str], failing: tuple[str, ...] = ()):
+        self._delays = {pos: 0.01 * (len(positions) - i) for i, pos in enumerate(positions)}
+        self._failing = failing
+
+    def fetch_transponders(self, position: str, channel_filter: str, cl: str) -> list[Transponder]:
+        time.sleep(self._delays[position])
+        if position in self._failing:
+            raise RuntimeError(f"boom {position}")
+        return [_transponder(f"Sat {position}")]
+
+
+def _run_step_1(tmp_path, positions: list[str], client: _StubKingOfSat) -> dict:
+    args = SimpleNamespace(
+        positions=positions,
+        kos_workers=4,
+        kos_filter="Clear",
+        kos_cl="eng",
+        kos_base_url="https://example.invalid/freqs.php",
+        kos_cache_dir=None,
+        kos_cache_ttl=0,
+        state_dir=str(tmp_path),
+    )
+    state = {"king_of_sat": client}
+    pipeline.step_1(args, state)
+    return state["transponders"]
+
+
+def test_step_1_keeps_positions_order_and_repeats(tmp_path):
+    positions = ["28.2E", "19.2E", "13.0E", "28.2E"]
+    payload = _run_step_1(tmp_path, positions, _StubKingOfSat(positions))
+    # Repeated positions are fetched and kept, as in a sequential run
+    assert [source["Key"] for source in payload["SourceList"]] == ["282E", "192E", "130E", "282E"]
+
+
+def test_step_1_skips_failed_position(tmp_path, caplog):
+    positions = ["28.2E", "19.2E"]
+    payload = _run_step_1(tmp_path, positions, _StubKingOfSat(positions, failing=("28.2E",)))
+    assert [source["Key"] for source in payload["SourceList"]] == ["192E"]
+    assert "Failed to fetch transponders for 28.2E: boom 28.2E" in caplog.text
+
+
+def test_step_1_raises_when_every_position_fails(tmp_path):
+    positions = ["28.2E"]
+    with pytest.raises(StepError):
+        _run_step_1(tmp_path, positions, _StubKingOfSat(positions, failing=("28.2E",)))